@@ -12,14 +12,24 @@ Event Flow:
 """
 
 import os
-import json
+import atexit
+import concurrent.futures
 import logging
+import socket
+import threading
+import time
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from cloudevents.http import from_http
+from werkzeug.exceptions import HTTPException
 from urllib.parse import unquote, urljoin
 
 # Configure logging
@@ -29,7 +39,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+class _OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (compact, insertion-ordered output)"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        # Hand orjson's bytes straight to the response, skipping a str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+
 app = Flask(__name__)
+app.json = _OrjsonProvider(app)
+# S3 notifications are small; reject oversized bodies (413) before parsing
+app.config['MAX_CONTENT_LENGTH'] = int(os.getenv('MAX_EVENT_BYTES', str(1024 * 1024)))
 
 # Configuration from environment variables
 KFP_ENDPOINT = os.getenv('KFP_ENDPOINT', 'https://ml-pipeline.finsight-agent.svc.cluster.local:8888')
@@ -39,6 +68,29 @@ EXPERIMENT_NAME = os.getenv('EXPERIMENT_NAME', 'Audio Transcription Runs')
 KFP_VERIFY_SSL = os.getenv('KFP_VERIFY_SSL', 'false').lower() in ('true', '1', 'yes', 'y')
 KFP_SSL_CA_CERT = os.getenv('KFP_SSL_CA_CERT')
 KFP_REQUEST_TIMEOUT = float(os.getenv('KFP_REQUEST_TIMEOUT', '60'))
+KFP_ID_CACHE_TTL = float(os.getenv('KFP_ID_CACHE_TTL', '300'))
+KFP_POOL_MAXSIZE = int(os.getenv('KFP_POOL_MAXSIZE', '64'))
+DNS_CACHE_TTL = float(os.getenv('DNS_CACHE_TTL', '30'))
+
+# Background trigger configuration
+TRIGGER_WORKERS = int(os.getenv('TRIGGER_WORKERS', '16'))
+TRIGGER_MAX_PENDING = int(os.getenv('TRIGGER_MAX_PENDING', '256'))
+TRIGGER_RETRIES = int(os.getenv('TRIGGER_RETRIES', '3'))
+TRIGGER_RETRY_BACKOFF = float(os.getenv('TRIGGER_RETRY_BACKOFF', '1.0'))
+
+# Event filtering: monitored buckets (comma-separated MONITORED_BUCKETS),
+# pipeline output prefixes to skip and accepted audio extensions (lowercase)
+_MONITORED_BUCKETS = frozenset(
+    bucket.strip() for bucket in os.getenv('MONITORED_BUCKETS', 'audio-inbox').split(',') if bucket.strip()
+)
+_IGNORE_PREFIXES = ('transcripts/',)
+_AUDIO_EXTS = ('.mp3', '.wav', '.m4a', '.flac', '.ogg')
+
+# Events arriving within BATCH_WINDOW_MS are coalesced into one pipeline run of
+# up to MAX_BATCH objects. Opt-in: multi-object runs pass s3_keys, which KFP
+# rejects until the pipeline version declaring it has been uploaded.
+BATCH_WINDOW_MS = int(os.getenv('BATCH_WINDOW_MS', '500'))
+MAX_BATCH = int(os.getenv('MAX_BATCH', '1'))
 
 # MinIO Configuration
 MINIO_ENDPOINT = os.getenv('MINIO_ENDPOINT', 'http://minio.minio.svc.cluster.local:9000')
@@ -49,20 +101,178 @@ MINIO_SECRET_KEY = os.getenv('MINIO_SECRET_KEY', 'minioadmin123')
 VOXTRAL_API_URL = os.getenv('VOXTRAL_API_URL', 'https://api.scaleway.ai/v1')
 VOXTRAL_API_KEY = os.getenv('VOXTRAL_API_KEY', '')
 VOXTRAL_MODEL = os.getenv('VOXTRAL_MODEL', 'voxtral-small-24b-2507')
+# Send presigned MinIO segment URLs instead of audio bytes; the Voxtral endpoint
+# must be able to reach MINIO_ENDPOINT (e.g. in-cluster vLLM)
+VOXTRAL_PRESIGNED_AUDIO_URLS = os.getenv('VOXTRAL_PRESIGNED_AUDIO_URLS', 'false').lower() in ('true', '1', 'yes', 'y')
 
 # Milvus Configuration
 MILVUS_HOST = os.getenv('MILVUS_HOST', 'milvus.finsight-agent.svc.cluster.local')
 MILVUS_PORT = os.getenv('MILVUS_PORT', '19530')
 COLLECTION_NAME = os.getenv('COLLECTION_NAME', 'earnings_call_transcripts')
 
+
+class _KFPAPIError(RuntimeError):
+    """KFP API call answered with an HTTP error status"""
+
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class _TTLCache:
+    """Single-value cache whose entry expires after ``ttl`` seconds.
+
+    Lookups are lock-free; on a miss only one thread runs the loader while
+    concurrent callers wait and then reuse its result.
+    """
+
+    def __init__(self, ttl: float):
+        self._ttl = ttl
+        self._entry: Optional[Tuple[str, float]] = None
+        self._lock = threading.Lock()
+
+    def _get(self) -> Optional[str]:
+        entry = self._entry
+        if entry and time.monotonic() < entry[1]:
+            return entry[0]
+        return None
+
+    def get_or_load(self, loader: Callable[[], str]) -> str:
+        value = self._get()
+        if value:
+            return value
+
+        with self._lock:
+            # Another thread may have resolved the value while we waited
+            value = self._get()
+            if not value:
+                value = loader()
+                self._entry = (value, time.monotonic() + self._ttl)
+        return value
+
+    def invalidate(self):
+        self._entry = None
+
+
+class _EventBatcher:
+    """Coalesces queued items into batches of up to ``max_batch``.
+
+    A consumer thread wakes on the first queued item, keeps collecting until
+    ``window`` seconds have passed or the batch is full, then hands the batch
+    to ``flush``.
+    """
+
+    def __init__(self, window: float, max_batch: int, flush: Callable[[List[Any]], None]):
+        self._window = window
+        self._max_batch = max(1, max_batch)
+        self._flush = flush
+        self._items: Deque[Any] = deque()
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def add(self, item: Any):
+        self._ensure_started()
+        self._items.append(item)
+        self._wakeup.set()
+
+    def _ensure_started(self):
+        # Started lazily so the thread lives in the serving (post-fork) process
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name='event-batcher', daemon=True)
+                    self._thread.start()
+
+    def close(self, timeout: Optional[float] = None):
+        """Stop the consumer thread and flush everything still queued"""
+        self._closed = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+        while self._items:
+            batch = []
+            while self._items and len(batch) < self._max_batch:
+                batch.append(self._items.popleft())
+            self._flush(batch)
+
+    def _run(self):
+        while not self._closed:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._closed:
+                # close() drains the queue from the calling thread
+                break
+
+            deadline = time.monotonic() + self._window
+            while len(self._items) < self._max_batch and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._wakeup.wait(remaining)
+                self._wakeup.clear()
+
+            batch = []
+            while self._items and len(batch) < self._max_batch:
+                batch.append(self._items.popleft())
+
+            # Leftovers start the next window straight away
+            if self._items:
+                self._wakeup.set()
+
+            if batch:
+                try:
+                    self._flush(batch)
+                except Exception as e:
+                    logger.error(f"Failed to flush event batch: {e}", exc_info=True)
+
+
 _kfp_session: Optional[requests.Session] = None
-_cached_pipeline_id: Optional[str] = None
-_cached_experiment_id: Optional[str] = None
+_dns_cache: Dict[Tuple[Any, ...], Tuple[Any, float]] = {}
+_resolve_uncached = socket.getaddrinfo
+_pipeline_id_cache = _TTLCache(KFP_ID_CACHE_TTL)
+_experiment_id_cache = _TTLCache(KFP_ID_CACHE_TTL)
+
+# Pipeline runs are created off the request path; the semaphore bounds the
+# backlog so a KFP outage surfaces as 503s (and broker redelivery) instead of
+# an unbounded in-memory queue.
+_trigger_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=TRIGGER_WORKERS,
+    thread_name_prefix='kfp-trigger',
+)
+_trigger_slots = threading.BoundedSemaphore(TRIGGER_MAX_PENDING)
+
+
+def _cached_getaddrinfo(*args, **kwargs):
+    """socket.getaddrinfo with a process-local TTL cache (successful lookups only)"""
+    key = (args, tuple(sorted(kwargs.items())))
+    now = time.monotonic()
+
+    entry = _dns_cache.get(key)
+    if entry and now < entry[1]:
+        return entry[0]
+
+    result = _resolve_uncached(*args, **kwargs)
+    _dns_cache[key] = (result, now + DNS_CACHE_TTL)
+    return result
+
+
+def _install_dns_cache():
+    """Route in-process name resolution through the TTL cache.
+
+    Keeps cluster-local lookups (e.g. the KFP service) from hitting CoreDNS
+    on every new connection. Disabled when DNS_CACHE_TTL <= 0.
+    """
+    if DNS_CACHE_TTL > 0 and socket.getaddrinfo is not _cached_getaddrinfo:
+        socket.getaddrinfo = _cached_getaddrinfo
 
 
 def _get_kfp_session() -> requests.Session:
     global _kfp_session
     if _kfp_session is None:
+        _install_dns_cache()
         session = requests.Session()
 
         if not KFP_VERIFY_SSL:
@@ -70,6 +280,26 @@ def _get_kfp_session() -> requests.Session:
         elif KFP_SSL_CA_CERT:
             session.verify = KFP_SSL_CA_CERT
 
+        # Size the pool for concurrent workers and block instead of discarding
+        # connections, so KFP calls reuse keep-alive TLS connections.
+        # Read/status retries only cover idempotent methods; connection failures
+        # are left to the trigger worker (_run_trigger), the single retry layer
+        # for run creation.
+        adapter = HTTPAdapter(
+            pool_connections=KFP_POOL_MAXSIZE,
+            pool_maxsize=KFP_POOL_MAXSIZE,
+            pool_block=True,
+            max_retries=Retry(
+                total=3,
+                connect=0,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
         session.headers.update({'Content-Type': 'application/json'})
         _kfp_session = session
 
@@ -79,6 +309,9 @@ def _get_kfp_session() -> requests.Session:
 def _kfp_request(method: str, path: str, **kwargs) -> Dict[str, Any]:
     url = urljoin(KFP_ENDPOINT.rstrip('/') + '/', path.lstrip('/'))
     timeout = kwargs.pop('timeout', KFP_REQUEST_TIMEOUT)
+    if 'json' in kwargs:
+        # Session already sends Content-Type: application/json
+        kwargs['data'] = orjson.dumps(kwargs.pop('json'))
 
     session = _get_kfp_session()
     response = session.request(method.upper(), url, timeout=timeout, **kwargs)
@@ -93,16 +326,17 @@ def _kfp_request(method: str, path: str, **kwargs) -> Dict[str, Any]:
                 'response': response.text,
             }
         )
-        raise RuntimeError(
-            f"KFP API {method.upper()} {url} failed: {response.status_code} - {response.text}"
+        raise _KFPAPIError(
+            f"KFP API {method.upper()} {url} failed: {response.status_code} - {response.text}",
+            response.status_code,
         )
 
     if not response.content:
         return {}
 
     try:
-        return response.json()
-    except ValueError:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
         logger.warning("Failed to decode JSON response from KFP", extra={'url': url})
         return {}
 
@@ -117,14 +351,14 @@ def _build_filter(display_name: str) -> str:
             }
         ]
     }
-    return json.dumps(filter_payload)
+    return orjson.dumps(filter_payload).decode()
 
 
 def _get_or_create_experiment_id() -> str:
-    global _cached_experiment_id
-    if _cached_experiment_id:
-        return _cached_experiment_id
+    return _experiment_id_cache.get_or_load(_resolve_experiment_id)
+
 
+def _resolve_experiment_id() -> str:
     params = {
         'namespace': KFP_NAMESPACE,
         'filter': _build_filter(EXPERIMENT_NAME),
@@ -134,9 +368,9 @@ def _get_or_create_experiment_id() -> str:
     experiments = _kfp_request('GET', '/apis/v2beta1/experiments', params=params)
     items = experiments.get('experiments') or []
     if items:
-        _cached_experiment_id = items[0].get('experiment_id')
-        logger.info(f"Using existing experiment: {EXPERIMENT_NAME} ({_cached_experiment_id})")
-        return _cached_experiment_id
+        experiment_id = items[0].get('experiment_id')
+        logger.info(f"Using existing experiment: {EXPERIMENT_NAME} ({experiment_id})")
+        return experiment_id
 
     payload = {
         'display_name': EXPERIMENT_NAME,
@@ -149,16 +383,15 @@ def _get_or_create_experiment_id() -> str:
     if not experiment_id:
         raise RuntimeError('Failed to create or retrieve experiment ID from KFP')
 
-    _cached_experiment_id = experiment_id
     logger.info(f"Created experiment: {EXPERIMENT_NAME} ({experiment_id})")
     return experiment_id
 
 
 def _get_pipeline_id() -> str:
-    global _cached_pipeline_id
-    if _cached_pipeline_id:
-        return _cached_pipeline_id
+    return _pipeline_id_cache.get_or_load(_resolve_pipeline_id)
 
+
+def _resolve_pipeline_id() -> str:
     params = {
         'namespace': KFP_NAMESPACE,
         'page_size': 200,
@@ -170,29 +403,34 @@ def _get_pipeline_id() -> str:
         if display_name == PIPELINE_NAME:
             pipeline_id = pipeline.get('pipeline_id') or pipeline.get('pipelineVersionId')
             if pipeline_id:
-                _cached_pipeline_id = pipeline_id
                 logger.info(f"Resolved pipeline '{PIPELINE_NAME}' to ID {pipeline_id}")
                 return pipeline_id
 
     raise RuntimeError(f"Pipeline '{PIPELINE_NAME}' not found in namespace '{KFP_NAMESPACE}'")
 
 
-def trigger_pipeline(bucket_name: str, object_key: str, event_time: str):
+def _warm_kfp_caches():
+    """Resolve pipeline and experiment IDs ahead of the first event"""
+    try:
+        _get_pipeline_id()
+        _get_or_create_experiment_id()
+    except Exception as e:
+        logger.warning(f"KFP cache warm-up failed, IDs will be resolved on first event: {e}")
+
+
+def trigger_pipeline(bucket_name: str, object_keys: List[str], event_time: str):
     """
     Trigger the audio transcription pipeline with the given parameters
     
     Args:
         bucket_name: S3 bucket name
-        object_key: S3 object key (file path)
+        object_keys: S3 object keys (file paths) processed by a single run
         event_time: Event timestamp
     """
     try:
-        experiment_id = _get_or_create_experiment_id()
-        pipeline_id = _get_pipeline_id()
-
         pipeline_params = {
             's3_bucket': bucket_name,
-            's3_key': object_key,
+            's3_key': object_keys[0],
             's3_endpoint_url': MINIO_ENDPOINT,
             's3_access_key': MINIO_ACCESS_KEY,
             's3_secret_key': MINIO_SECRET_KEY,
@@ -203,27 +441,48 @@ def trigger_pipeline(bucket_name: str, object_key: str, event_time: str):
             'milvus_port': MILVUS_PORT,
             'collection_name': COLLECTION_NAME
         }
+        # Single-object runs stay compatible with pipeline versions that
+        # predate the s3_keys parameter
+        if len(object_keys) > 1:
+            pipeline_params['s3_keys'] = orjson.dumps(object_keys).decode()
+        if VOXTRAL_PRESIGNED_AUDIO_URLS:
+            pipeline_params['presigned_audio_urls'] = True
         
         # Generate run name with timestamp
-        run_name = f"audio-{object_key.replace('/', '-')}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-
-        payload = {
-            'display_name': run_name,
-            'pipeline_version_reference': {
-                'pipeline_id': pipeline_id,
-            },
-            'runtime_config': {
-                'parameters': pipeline_params,
-            },
-        }
+        run_label = object_keys[0].replace('/', '-') if len(object_keys) == 1 else f"batch-{len(object_keys)}"
+        run_name = f"audio-{run_label}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+
+        for attempt in range(2):
+            experiment_id = _get_or_create_experiment_id()
+            pipeline_id = _get_pipeline_id()
+
+            payload = {
+                'display_name': run_name,
+                'pipeline_version_reference': {
+                    'pipeline_id': pipeline_id,
+                },
+                'runtime_config': {
+                    'parameters': pipeline_params,
+                },
+            }
 
-        response = _kfp_request(
-            'POST',
-            '/apis/v2beta1/runs',
-            params={'experiment_id': experiment_id},
-            json=payload,
-            timeout=max(KFP_REQUEST_TIMEOUT, 90),
-        )
+            try:
+                response = _kfp_request(
+                    'POST',
+                    '/apis/v2beta1/runs',
+                    params={'experiment_id': experiment_id},
+                    json=payload,
+                    timeout=max(KFP_REQUEST_TIMEOUT, 90),
+                )
+                break
+            except _KFPAPIError as e:
+                # A re-uploaded pipeline or deleted experiment leaves the cached
+                # IDs stale; the run was rejected, so resolve afresh and retry once
+                if attempt or e.status_code not in (400, 404):
+                    raise
+                logger.warning(f"Run creation rejected ({e.status_code}), refreshing cached KFP IDs")
+                _pipeline_id_cache.invalidate()
+                _experiment_id_cache.invalidate()
 
         run_id = response.get('run_id')
 
@@ -231,7 +490,7 @@ def trigger_pipeline(bucket_name: str, object_key: str, event_time: str):
         if run_id:
             logger.info(f"   Run ID: {run_id}")
         logger.info(f"   Bucket: {bucket_name}")
-        logger.info(f"   Object: {object_key}")
+        logger.info(f"   Objects: {', '.join(object_keys)}")
 
         return response
         
@@ -240,6 +499,103 @@ def trigger_pipeline(bucket_name: str, object_key: str, event_time: str):
         raise
 
 
+def _is_transient_trigger_error(exc: Exception) -> bool:
+    # Only failures where the run cannot exist yet. Once the request was sent,
+    # a dropped connection, read timeout or 504/500 may hide a created run.
+    # requests raises ConnectTimeout for urllib3's NewConnectionError too.
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    return isinstance(exc, _KFPAPIError) and exc.status_code in (502, 503)
+
+
+def _run_trigger(bucket_name: str, object_keys: List[str], event_time: str, slots: int):
+    try:
+        for attempt in range(TRIGGER_RETRIES + 1):
+            try:
+                trigger_pipeline(bucket_name, object_keys, event_time)
+                return
+            except Exception as e:
+                # Already logged by trigger_pipeline; keep the worker thread alive
+                if attempt == TRIGGER_RETRIES or not _is_transient_trigger_error(e):
+                    return
+
+                delay = TRIGGER_RETRY_BACKOFF * (2 ** attempt)
+                logger.warning(
+                    f"Retrying pipeline trigger for {len(object_keys)} object(s) in {delay:.1f}s "
+                    f"(attempt {attempt + 2}/{TRIGGER_RETRIES + 1})"
+                )
+                time.sleep(delay)
+    finally:
+        _trigger_slots.release(slots)
+
+
+def _flush_event_batch(batch: List[Tuple[str, str, str]]):
+    """Submit one pipeline run per bucket for a coalesced batch of events"""
+    by_bucket: Dict[str, Dict[str, str]] = {}
+    for bucket_name, object_key, event_time in batch:
+        # dict keeps first-seen order and drops duplicate keys within the batch
+        by_bucket.setdefault(bucket_name, {}).setdefault(object_key, event_time)
+
+    released = len(batch)
+    for bucket_name, keys in by_bucket.items():
+        object_keys = list(keys)
+        slots = len(object_keys)
+        released -= slots
+        logger.info(f"Submitting batch of {slots} object(s) from bucket {bucket_name}")
+        try:
+            _trigger_executor.submit(_run_trigger, bucket_name, object_keys, keys[object_keys[0]], slots)
+        except RuntimeError:
+            # Executor already shut down at interpreter exit: trigger inline
+            _run_trigger(bucket_name, object_keys, keys[object_keys[0]], slots)
+
+    # Duplicates never reach a worker, so free their slots here
+    if released:
+        _trigger_slots.release(released)
+
+
+_event_batcher = _EventBatcher(BATCH_WINDOW_MS / 1000.0, MAX_BATCH, _flush_event_batch)
+
+
+@atexit.register
+def _drain_pending_triggers():
+    """Trigger runs for accepted events before the worker process exits"""
+    # Events were acknowledged with 202, so a restart or scale-down must not
+    # drop the ones still waiting in the batch window
+    _event_batcher.close()
+    _trigger_executor.shutdown(wait=True)
+
+
+def enqueue_pipeline_trigger(bucket_name: str, object_key: str, event_time: str) -> bool:
+    """
+    Queue an object for the next coalesced pipeline run
+    
+    Returns:
+        False if the pending backlog is full and the event was not queued
+    """
+    if not _trigger_slots.acquire(blocking=False):
+        return False
+
+    _event_batcher.add((bucket_name, object_key, event_time))
+    return True
+
+
+_warmup_started = False
+_warmup_lock = threading.Lock()
+
+
+@app.before_request
+def _start_kfp_cache_warmup():
+    """Warm the KFP ID caches in the background once the first request arrives"""
+    # Not at import time, so importing the module has no network side effects;
+    # readiness probes trigger this well before the first event
+    global _warmup_started
+    if not _warmup_started:
+        with _warmup_lock:
+            if not _warmup_started:
+                _warmup_started = True
+                threading.Thread(target=_warm_kfp_caches, name='kfp-cache-warmup', daemon=True).start()
+
+
 @app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint"""
@@ -264,13 +620,13 @@ def handle_event():
     Expects CloudEvent with S3 event data in the data field
     """
     try:
-        # Parse CloudEvent
-        event = from_http(request.headers, request.get_data())
+        # Parse CloudEvent (cache=False: don't keep a second copy of the body)
+        event = from_http(request.headers, request.get_data(cache=False))
         
-        logger.info(f"📨 Received CloudEvent:")
-        logger.info(f"   Type: {event['type']}")
-        logger.info(f"   Source: {event['source']}")
-        logger.info(f"   Subject: {event.get('subject', 'N/A')}")
+        logger.info("📨 Received CloudEvent:")
+        logger.info("   Type: %s", event['type'])
+        logger.info("   Source: %s", event['source'])
+        logger.info("   Subject: %s", event.get('subject', 'N/A'))
         
         # Extract S3 event data
         event_data = event.data
@@ -297,49 +653,49 @@ def handle_event():
             event_time = record.get('eventTime', datetime.now().isoformat())
         
         if not bucket_name or not object_key:
-            logger.warning(f"Missing bucket or object key in event data: {event_data}")
+            logger.warning("Missing bucket or object key in event data: %s", event_data)
             return jsonify({'status': 'ignored', 'reason': 'invalid event structure'}), 200
 
-        object_key = unquote(object_key)
-        
-        # Only process audio files in audio-inbox bucket
-        if bucket_name != 'audio-inbox':
-            logger.info(f"Ignoring event from bucket: {bucket_name}")
+        # Only process audio files in monitored buckets
+        if bucket_name not in _MONITORED_BUCKETS:
+            logger.info("Ignoring event from bucket: %s", bucket_name)
             return jsonify({'status': 'ignored', 'reason': f'bucket {bucket_name} not monitored'}), 200
+
+        object_key = unquote(object_key)
+        lower_key = object_key.lower()
         
         # Skip pipeline output objects to avoid retriggering on transcripts or segments
-        if object_key.lower().startswith('transcripts/'):
-            logger.info(f"Ignoring pipeline output object: {object_key}")
+        if lower_key.startswith(_IGNORE_PREFIXES):
+            logger.info("Ignoring pipeline output object: %s", object_key)
             return jsonify({'status': 'ignored', 'reason': 'transcript artifacts are not ingested'}), 200
 
         # Only process audio files
-        audio_extensions = ['.mp3', '.wav', '.m4a', '.flac', '.ogg']
-        if not any(object_key.lower().endswith(ext) for ext in audio_extensions):
-            logger.info(f"Ignoring non-audio file: {object_key}")
+        if not lower_key.endswith(_AUDIO_EXTS):
+            logger.info("Ignoring non-audio file: %s", object_key)
             return jsonify({'status': 'ignored', 'reason': 'not an audio file'}), 200
         
-        logger.info(f"🎵 Processing audio file: s3://{bucket_name}/{object_key}")
+        logger.info("🎵 Processing audio file: s3://%s/%s", bucket_name, object_key)
         
-        # Trigger pipeline
-        run = trigger_pipeline(bucket_name, object_key, event_time)
-        
-        if run:
-            run_id = run.get('run_id')
-            return jsonify({
-                'status': 'success',
-                'message': 'Pipeline triggered',
-                'run_id': run_id,
-                'bucket': bucket_name,
-                'object': object_key
-            }), 200
-        else:
+        # Acknowledge immediately; the run is created by a background worker
+        if not enqueue_pipeline_trigger(bucket_name, object_key, event_time):
+            logger.warning("Trigger backlog full, rejecting event for %s", object_key)
             return jsonify({
                 'status': 'error',
-                'message': 'Failed to trigger pipeline'
-            }), 500
+                'message': 'Pipeline trigger backlog full, retry later'
+            }), 503
+
+        return jsonify({
+            'status': 'accepted',
+            'message': 'Pipeline trigger queued',
+            'bucket': bucket_name,
+            'object': object_key
+        }), 202
         
+    except HTTPException:
+        # Let Flask render client errors such as 413 for oversized bodies
+        raise
     except Exception as e:
-        logger.error(f"Error handling event: {e}", exc_info=True)
+        logger.error("Error handling event: %s", e, exc_info=True)
         return jsonify({
             'status': 'error',
             'message': str(e)
@@ -5,17 +5,74 @@ Provides Voxtral API integration for audio-to-text transcription.
 Supports both Scaleway GenAI API and self-hosted vLLM endpoints.
 """
 
+import asyncio
 import base64
+import concurrent.futures
+import importlib.util
+import json
 import logging
-from typing import Dict, List, Any, Optional
+import mimetypes
+import queue
+import threading
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
 from pathlib import Path
-from openai import OpenAI
-from tqdm import tqdm
 import time
 
+# HTTP clients and tqdm are imported where they are used, so demo-mode runs
+# and progress-less callers don't pay their import cost
+if TYPE_CHECKING:
+    import aiohttp
+    from openai import OpenAI
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound for a single Voxtral round-trip (upload + inference)
+REQUEST_TIMEOUT_SECONDS = 600.0
+
+# 57 KiB: a multiple of 3, so streamed base64 blocks never carry padding
+BASE64_READ_BLOCK_SIZE = 57 * 1024
+
+# 'multipart' uploads the raw file to /audio/transcriptions; 'base64' embeds
+# the encoded audio in a /chat/completions message
+UPLOAD_MODES = ('multipart', 'base64')
+
+# Segments encoded ahead of the SDK workers in base64 mode
+BASE64_PREFETCH_SEGMENTS = 4
+
+# Lifetime of presigned MinIO URLs handed to the API instead of audio bytes
+PRESIGNED_URL_EXPIRY_SECONDS = 900
+
+
+def encode_audio_file_to_base64_bytes(file_path: str) -> bytearray:
+    """
+    Stream-encode audio file to base64 without holding the raw bytes in memory.
+
+    The file is read in blocks whose size is a multiple of 3, so every
+    block encodes without padding and the pieces concatenate cleanly.
+
+    Args:
+        file_path: Path to the audio file
+
+    Returns:
+        Base64 encoded ASCII bytes of the audio file
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        RuntimeError: If encoding fails
+    """
+    try:
+        encoded = bytearray()
+        with open(file_path, 'rb', buffering=1 << 20) as audio_file:
+            while chunk := audio_file.read(BASE64_READ_BLOCK_SIZE):
+                encoded.extend(base64.b64encode(chunk))
+        return encoded
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Audio file not found: {file_path}")
+    except Exception as e:
+        raise RuntimeError(f"Error encoding audio file to base64: {e}")
+
 
 def encode_audio_file_to_base64(file_path: str) -> str:
     """
@@ -32,22 +89,106 @@ def encode_audio_file_to_base64(file_path: str) -> str:
         FileNotFoundError: If file doesn't exist
         RuntimeError: If encoding fails
     """
+    return encode_audio_file_to_base64_bytes(file_path).decode('ascii')
+
+
+def _audio_content_type(file_path: str) -> str:
+    return mimetypes.guess_type(file_path)[0] or 'audio/wav'
+
+
+def _chat_audio_params(model: str, audio_part: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "model": model,
+        "messages": [
+            {
+                "role": "user",
+                "content": [audio_part]
+            }
+        ],
+        "temperature": 0.0,  # Deterministic transcription
+        "max_tokens": 2048
+    }
+
+
+def _chat_transcription_params(model: str, encoded_audio: str) -> Dict[str, Any]:
+    """Chat completion body for 'base64' mode, shared by both backends."""
+    return _chat_audio_params(model, {"type": "audio", "audio": encoded_audio})
+
+
+def _chat_audio_url_params(model: str, audio_url: str) -> Dict[str, Any]:
+    """Chat completion body pointing the API at a presigned segment URL."""
+    return _chat_audio_params(model, {"type": "audio_url", "audio_url": {"url": audio_url}})
+
+
+def _presigned_audio_url(s3_client: Optional[Any], segment: Dict[str, Any]) -> Optional[str]:
+    """Presigned GET URL for a segment already stored in S3/MinIO, if any."""
+    bucket = segment.get('s3_bucket')
+    key = segment.get('s3_key')
+    if s3_client is None or not bucket or not key:
+        return None
+
     try:
-        with open(file_path, 'rb') as audio_file:
-            audio_data = audio_file.read()
-            return base64.b64encode(audio_data).decode('utf-8')
-    except FileNotFoundError:
-        raise FileNotFoundError(f"Audio file not found: {file_path}")
+        # Signed locally by boto3, no request is made
+        return s3_client.generate_presigned_url(
+            'get_object',
+            Params={'Bucket': bucket, 'Key': key},
+            ExpiresIn=PRESIGNED_URL_EXPIRY_SECONDS
+        )
     except Exception as e:
-        raise RuntimeError(f"Error encoding audio file to base64: {e}")
+        logger.warning(f"Could not presign s3://{bucket}/{key}: {e}")
+        return None
+
+
+def _chat_transcription_body(model: str, encoded_audio: bytes) -> bytes:
+    """
+    Serialized _chat_transcription_params with the base64 bytes spliced in.
+
+    Base64 needs no JSON escaping, so the audio is never decoded to str or
+    re-serialized along with the rest of the body.
+    """
+    head, tail = json.dumps(_chat_transcription_params(model, '\0')).split('"\\u0000"')
+    return b''.join((head.encode(), b'"', encoded_audio, b'"', tail.encode()))
+
+
+def _upload_transcription_params(model: str) -> Dict[str, Any]:
+    """Form fields sent alongside the file in 'multipart' mode."""
+    return {
+        "model": model,
+        "temperature": 0.0  # Deterministic transcription
+    }
+
+
+def _audio_file_part(segment_path: str) -> tuple[str, str]:
+    """Filename and content type of the uploaded segment file."""
+    return Path(segment_path).name, _audio_content_type(segment_path)
+
+
+def _segment_result(
+    segment: Dict[str, Any],
+    text: str,
+    error: Optional[str] = None
+) -> Dict[str, Any]:
+    return {
+        'segment_id': segment.get('segment_id', 0),
+        'text': text,
+        'start_time': segment.get('start_time', 0.0),
+        'end_time': segment.get('end_time', 0.0),
+        'duration': segment.get('duration', 0.0),
+        'filename': segment.get('filename', ''),
+        'success': error is None,
+        'error': error
+    }
 
 
 def transcribe_audio_segment(
-    client: OpenAI,
+    client: "OpenAI",
     segment: Dict[str, Any],
     model: str = "voxtral-small-24b-2507",
     max_retries: int = 3,
-    retry_delay: float = 2.0
+    retry_delay: float = 2.0,
+    upload_mode: str = "multipart",
+    encoded_audio: Optional[str] = None,
+    s3_client: Optional[Any] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Transcribe a single audio segment using Voxtral API.
@@ -58,6 +199,12 @@ def transcribe_audio_segment(
         model: Model name for transcription
         max_retries: Maximum number of retry attempts
         retry_delay: Delay between retries in seconds
+        upload_mode: One of UPLOAD_MODES
+        encoded_audio: Precomputed base64 audio for 'base64' mode; encoded
+            from the segment file when omitted
+        s3_client: boto3 S3 client; when the segment carries 's3_bucket' and
+            's3_key', the API is sent a presigned URL instead of the audio
+            and upload_mode is only used as a fallback
         
     Returns:
         Dictionary containing transcription result or None if failed
@@ -73,43 +220,44 @@ def transcribe_audio_segment(
     """
     segment_id = segment.get('segment_id', 0)
     segment_path = segment.get('path', '')
+    use_audio_url = s3_client is not None
     
     for attempt in range(max_retries):
         try:
-            # Encode audio to base64
-            encoded_audio = encode_audio_file_to_base64(segment_path)
+            transcription_text = None
             
-            # Call Voxtral API (OpenAI-compatible)
-            response = client.chat.completions.create(
-                model=model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "audio",
-                                "audio": encoded_audio
-                            }
-                        ]
-                    }
-                ],
-                temperature=0.0,  # Deterministic transcription
-                max_tokens=2048
-            )
+            # Presigned on every attempt so a retry never sends an expired URL
+            audio_url = _presigned_audio_url(s3_client, segment) if use_audio_url else None
+            if audio_url:
+                try:
+                    response = client.chat.completions.create(
+                        **_chat_audio_url_params(model, audio_url)
+                    )
+                    transcription_text = response.choices[0].message.content
+                except Exception as e:
+                    logger.warning(f"Presigned URL transcription failed for segment {segment_id}, falling back to {upload_mode} upload: {e}")
+                    use_audio_url = False
             
-            # Extract transcription text
-            transcription_text = response.choices[0].message.content
+            if transcription_text is None and upload_mode == 'base64':
+                # Encoded once and reused across retries
+                if encoded_audio is None:
+                    encoded_audio = encode_audio_file_to_base64(segment_path)
+                
+                response = client.chat.completions.create(
+                    **_chat_transcription_params(model, encoded_audio)
+                )
+                transcription_text = response.choices[0].message.content
+            elif transcription_text is None:
+                # Upload the raw segment file (multipart) to the transcription endpoint
+                with open(segment_path, 'rb') as audio_file:
+                    filename, content_type = _audio_file_part(segment_path)
+                    response = client.audio.transcriptions.create(
+                        file=(filename, audio_file, content_type),
+                        **_upload_transcription_params(model)
+                    )
+                transcription_text = response.text
             
-            return {
-                'segment_id': segment_id,
-                'text': transcription_text,
-                'start_time': segment.get('start_time', 0.0),
-                'end_time': segment.get('end_time', 0.0),
-                'duration': segment.get('duration', 0.0),
-                'filename': segment.get('filename', ''),
-                'success': True,
-                'error': None
-            }
+            return _segment_result(segment, transcription_text)
             
         except Exception as e:
             logger.warning(f"Attempt {attempt + 1}/{max_retries} failed for segment {segment_id}: {e}")
@@ -118,27 +266,294 @@ def transcribe_audio_segment(
                 time.sleep(retry_delay * (attempt + 1))  # Exponential backoff
             else:
                 logger.error(f"All retries exhausted for segment {segment_id}")
-                return {
-                    'segment_id': segment_id,
-                    'text': '',
-                    'start_time': segment.get('start_time', 0.0),
-                    'end_time': segment.get('end_time', 0.0),
-                    'duration': segment.get('duration', 0.0),
-                    'filename': segment.get('filename', ''),
-                    'success': False,
-                    'error': str(e)
-                }
+                return _segment_result(segment, '', str(e))
     
     return None
 
 
+async def transcribe_audio_segment_async(
+    session: "aiohttp.ClientSession",
+    api_url: str,
+    api_key: str,
+    segment: Dict[str, Any],
+    semaphore: asyncio.Semaphore,
+    model: str = "voxtral-small-24b-2507",
+    max_retries: int = 3,
+    retry_delay: float = 2.0,
+    upload_mode: str = "multipart",
+    s3_client: Optional[Any] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Transcribe a single audio segment against the OpenAI-compatible API,
+    either as a multipart upload to the audio transcriptions endpoint or as
+    base64 audio in a chat completion (see UPLOAD_MODES).
+
+    Args:
+        session: Shared aiohttp session used for all segments
+        api_url: Voxtral API endpoint URL
+        api_key: API authentication key
+        segment: Segment metadata dictionary containing 'path' key
+        semaphore: Bounds the number of in-flight requests
+        model: Model name for transcription
+        max_retries: Maximum number of retry attempts
+        retry_delay: Delay between retries in seconds
+        upload_mode: One of UPLOAD_MODES
+        s3_client: Optional boto3 S3 client for presigned segment URLs (see
+            transcribe_audio_segment)
+
+    Returns:
+        Dictionary containing transcription result (same shape as
+        transcribe_audio_segment) or None if failed
+    """
+    import aiohttp
+
+    segment_id = segment.get('segment_id', 0)
+    segment_path = segment.get('path', '')
+    base_url = api_url.rstrip('/')
+    headers = {'Authorization': f'Bearer {api_key}'}
+    encoded_audio: Optional[bytearray] = None
+    use_audio_url = s3_client is not None
+
+    async with semaphore:
+        for attempt in range(max_retries):
+            try:
+                transcription_text = None
+
+                # Presigned per attempt, once a slot is held, so the URL is
+                # fresh when the request actually goes out
+                audio_url = _presigned_audio_url(s3_client, segment) if use_audio_url else None
+                if audio_url:
+                    try:
+                        async with session.post(
+                            f"{base_url}/chat/completions",
+                            json=_chat_audio_url_params(model, audio_url),
+                            headers=headers
+                        ) as response:
+                            response.raise_for_status()
+                            body = await response.json()
+                        transcription_text = body['choices'][0]['message']['content']
+                    except Exception as e:
+                        logger.warning(f"Presigned URL transcription failed for segment {segment_id}, falling back to {upload_mode} upload: {e}")
+                        use_audio_url = False
+
+                if transcription_text is None and upload_mode == 'base64':
+                    if encoded_audio is None:
+                        # Encode off the event loop so it overlaps the other
+                        # in-flight requests; reused across retries
+                        encoded_audio = await asyncio.to_thread(encode_audio_file_to_base64_bytes, segment_path)
+
+                    body = _chat_transcription_body(model, encoded_audio)
+
+                    async with session.post(
+                        f"{base_url}/chat/completions",
+                        data=body,
+                        headers={**headers, 'Content-Type': 'application/json'}
+                    ) as response:
+                        response.raise_for_status()
+                        body = await response.json()
+                    transcription_text = body['choices'][0]['message']['content']
+                elif transcription_text is None:
+                    with open(segment_path, 'rb') as audio_file:
+                        form = aiohttp.FormData()
+                        for name, value in _upload_transcription_params(model).items():
+                            form.add_field(name, str(value))
+                        filename, content_type = _audio_file_part(segment_path)
+                        form.add_field('file', audio_file, filename=filename, content_type=content_type)
+
+                        async with session.post(f"{base_url}/audio/transcriptions", data=form, headers=headers) as response:
+                            response.raise_for_status()
+                            body = await response.json()
+                    transcription_text = body['text']
+
+                return _segment_result(segment, transcription_text)
+
+            except Exception as e:
+                logger.warning(f"Attempt {attempt + 1}/{max_retries} failed for segment {segment_id}: {e}")
+
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(retry_delay * (attempt + 1))
+                else:
+                    logger.error(f"All retries exhausted for segment {segment_id}")
+                    return _segment_result(segment, '', str(e))
+
+    return None
+
+
+async def _transcribe_segments_aiohttp(
+    api_url: str,
+    api_key: str,
+    segments: List[Dict[str, Any]],
+    model: str,
+    max_retries: int,
+    show_progress: bool,
+    concurrency: int,
+    upload_mode: str,
+    s3_client: Optional[Any]
+) -> List[Optional[Dict[str, Any]]]:
+    """Fan segments out over a shared aiohttp session; results keep input order."""
+    import aiohttp
+
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        tasks = [
+            asyncio.ensure_future(transcribe_audio_segment_async(
+                session=session,
+                api_url=api_url,
+                api_key=api_key,
+                segment=segment,
+                semaphore=semaphore,
+                model=model,
+                max_retries=max_retries,
+                upload_mode=upload_mode,
+                s3_client=s3_client
+            ))
+            for segment in segments
+        ]
+
+        # Transcribe segments with progress tracking
+        if show_progress:
+            from tqdm import tqdm
+
+            progress = tqdm(total=len(tasks), desc="Transcribing segments")
+            for task in tasks:
+                task.add_done_callback(lambda _: progress.update(1))
+            try:
+                return await asyncio.gather(*tasks)
+            finally:
+                progress.close()
+
+        return await asyncio.gather(*tasks)
+
+
+def _encode_segments_ahead(
+    segments: List[Dict[str, Any]],
+    slots: threading.Semaphore,
+    encoded_segments: "queue.Queue[Optional[tuple]]"
+) -> None:
+    """Producer for the SDK backend's base64 mode; None marks the end."""
+    for index, segment in enumerate(segments):
+        slots.acquire()
+        try:
+            encoded_audio = encode_audio_file_to_base64(segment.get('path', ''))
+        except Exception as e:
+            # Left to the worker, which re-encodes and reports the failure
+            logger.warning(f"Pre-encoding failed for segment {segment.get('segment_id', 0)}: {e}")
+            encoded_audio = None
+        encoded_segments.put((index, segment, encoded_audio))
+    encoded_segments.put(None)
+
+
+def _transcribe_segments_sdk(
+    api_url: str,
+    api_key: str,
+    segments: List[Dict[str, Any]],
+    model: str,
+    max_retries: int,
+    show_progress: bool,
+    concurrency: int,
+    upload_mode: str,
+    s3_client: Optional[Any]
+) -> List[Optional[Dict[str, Any]]]:
+    """Run transcribe_audio_segment on a thread pool; results keep input order."""
+    import httpx
+    from openai import OpenAI
+
+    # Long-lived keep-alive connections so bursts and retries reuse TLS sessions;
+    # retries are handled per segment, so the transport never retries itself
+    # (limits must live on the transport: httpx ignores Client limits when a
+    # custom transport is supplied)
+    http_client = httpx.Client(
+        transport=httpx.HTTPTransport(
+            retries=0,
+            # HTTP/2 needs the optional h2 package
+            http2=importlib.util.find_spec('h2') is not None,
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32,
+                keepalive_expiry=60.0
+            )
+        ),
+        timeout=httpx.Timeout(REQUEST_TIMEOUT_SECONDS, connect=10.0)
+    )
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(segments)
+    max_workers = max(1, min(concurrency, len(segments)))
+    progress = None
+
+    try:
+        # The SDK's own retries (2 by default) would multiply with the per-segment ones
+        with OpenAI(base_url=api_url, api_key=api_key, http_client=http_client, max_retries=0) as client, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # With presigned URLs the audio is normally never encoded, so the
+            # workers only encode on fallback
+            if upload_mode == 'base64' and s3_client is None:
+                # Producer/consumer: a background thread encodes segments ahead while
+                # the workers are waiting on the network. Slots are released as
+                # requests finish, capping encoded payloads held in memory.
+                slots = threading.Semaphore(max_workers + BASE64_PREFETCH_SEGMENTS)
+                encoded_segments: "queue.Queue[Optional[tuple]]" = queue.Queue()
+                threading.Thread(
+                    target=_encode_segments_ahead,
+                    args=(segments, slots, encoded_segments),
+                    name='base64-encoder',
+                    daemon=True
+                ).start()
+                submissions = iter(encoded_segments.get, None)
+            else:
+                slots = None
+                submissions = ((index, segment, None) for index, segment in enumerate(segments))
+
+            # Progress advances as requests finish, including while later
+            # segments are still being submitted
+            if show_progress:
+                from tqdm import tqdm
+
+                progress = tqdm(total=len(segments), desc="Transcribing segments")
+
+            futures = {}
+            for index, segment, encoded_audio in submissions:
+                future = executor.submit(
+                    transcribe_audio_segment,
+                    client=client,
+                    segment=segment,
+                    model=model,
+                    max_retries=max_retries,
+                    upload_mode=upload_mode,
+                    encoded_audio=encoded_audio,
+                    s3_client=s3_client
+                )
+                if slots is not None:
+                    future.add_done_callback(lambda _: slots.release())
+                if progress is not None:
+                    future.add_done_callback(lambda _: progress.update(1))
+                futures[future] = index
+
+            for future, index in futures.items():
+                results[index] = future.result()
+    finally:
+        # Closing the OpenAI client closes http_client too, but not if the
+        # client or the executor failed to start
+        http_client.close()
+        if progress is not None:
+            progress.close()
+
+    return results
+
+
 def batch_transcribe_segments(
     api_url: str,
     api_key: str,
     segments: List[Dict[str, Any]],
     model: str = "voxtral-small-24b-2507",
     max_retries: int = 3,
-    show_progress: bool = True
+    show_progress: bool = True,
+    concurrency: int = 8,
+    use_sdk: bool = False,
+    upload_mode: str = "multipart",
+    s3_client: Optional[Any] = None
 ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     """
     Transcribe multiple audio segments in batch.
@@ -150,6 +565,15 @@ def batch_transcribe_segments(
         model: Model name for transcription
         max_retries: Maximum retry attempts per segment
         show_progress: Whether to show progress bar
+        concurrency: Maximum number of segments transcribed in parallel
+        use_sdk: Use the OpenAI SDK on a thread pool instead of aiohttp;
+            implied when aiohttp is not installed
+        upload_mode: 'multipart' (raw file to the transcriptions endpoint) or
+            'base64' (encoded audio in a chat completion, for endpoints that
+            only accept audio through chat)
+        s3_client: Optional boto3 S3 client; segments carrying 's3_bucket'
+            and 's3_key' are sent as presigned URLs instead of audio bytes,
+            so the API endpoint must be able to reach the S3 endpoint
         
     Returns:
         Tuple of (successful_transcriptions, failed_transcriptions)
@@ -196,26 +620,32 @@ def batch_transcribe_segments(
         )
         return successful_transcriptions, []
 
-    # Initialize OpenAI client for real transcriptions
-    client = OpenAI(
-        base_url=api_url,
-        api_key=api_key
-    )
+    if upload_mode not in UPLOAD_MODES:
+        raise ValueError(f"Unsupported upload_mode '{upload_mode}', expected one of {UPLOAD_MODES}")
 
-    successful_transcriptions: List[Dict[str, Any]] = []
-    failed_transcriptions: List[Dict[str, Any]] = []
+    concurrency = max(1, concurrency)
 
-    # Transcribe segments with progress tracking
-    iterator = tqdm(segments, desc="Transcribing segments") if show_progress else segments
+    # aiohttp is optional: images built for the SDK-only component lack it
+    if not use_sdk and importlib.util.find_spec('aiohttp') is None:
+        logger.info("aiohttp is not installed, using the OpenAI SDK backend")
+        use_sdk = True
 
-    for segment in iterator:
-        result = transcribe_audio_segment(
-            client=client,
-            segment=segment,
-            model=model,
-            max_retries=max_retries
+    if use_sdk:
+        results = _transcribe_segments_sdk(
+            api_url, api_key, segments, model, max_retries, show_progress, concurrency, upload_mode,
+            s3_client
         )
+    else:
+        results = asyncio.run(_transcribe_segments_aiohttp(
+            api_url, api_key, segments, model, max_retries, show_progress, concurrency, upload_mode,
+            s3_client
+        ))
+
+    successful_transcriptions: List[Dict[str, Any]] = []
+    failed_transcriptions: List[Dict[str, Any]] = []
 
+    # Results are returned in input order, so they line up with segments
+    for segment, result in zip(segments, results):
         if result and result['success']:
             successful_transcriptions.append(result)
         else:
@@ -230,6 +660,11 @@ def batch_transcribe_segments(
     return successful_transcriptions, failed_transcriptions
 
 
+def _format_timestamp(seconds: float) -> str:
+    minutes, secs = divmod(int(seconds), 60)
+    return f"{minutes:02d}:{secs:02d}"
+
+
 def create_complete_transcript(
     transcriptions: List[Dict[str, Any]],
     output_path: Optional[Path] = None
@@ -239,51 +674,37 @@ def create_complete_transcript(
     
     Args:
         transcriptions: List of transcription result dictionaries
+            (sorted in place by segment_id)
         output_path: Optional path to save the transcript file
         
     Returns:
         Complete transcript as a string
     """
     # Sort by segment_id to ensure correct order
-    sorted_transcriptions = sorted(transcriptions, key=lambda x: x['segment_id'])
+    transcriptions.sort(key=itemgetter('segment_id'))
     
     # Build transcript with timestamps
-    transcript_lines = []
-    transcript_lines.append("=== EARNINGS CALL TRANSCRIPT ===\n")
-    
-    for trans in sorted_transcriptions:
-        start_time = trans['start_time']
-        end_time = trans['end_time']
-        text = trans['text'].strip()
-        
-        # Format timestamp
-        start_min = int(start_time // 60)
-        start_sec = int(start_time % 60)
-        end_min = int(end_time // 60)
-        end_sec = int(end_time % 60)
-        
-        timestamp = f"[{start_min:02d}:{start_sec:02d} - {end_min:02d}:{end_sec:02d}]"
-        
-        transcript_lines.append(f"\n{timestamp}")
-        transcript_lines.append(text)
+    header = "=== EARNINGS CALL TRANSCRIPT ===\n"
+    body = ''.join(
+        f"\n\n[{_format_timestamp(trans['start_time'])} - {_format_timestamp(trans['end_time'])}]"
+        f"\n{trans['text'].strip()}"
+        for trans in transcriptions
+    )
     
     # Add summary footer
-    transcript_lines.append("\n\n=== END TRANSCRIPT ===")
-    transcript_lines.append(f"\nTotal segments: {len(sorted_transcriptions)}")
+    footer = f"\n\n\n=== END TRANSCRIPT ===\n\nTotal segments: {len(transcriptions)}"
     
-    if sorted_transcriptions:
-        total_duration = sorted_transcriptions[-1]['end_time']
-        transcript_lines.append(f"Total duration: {int(total_duration // 60)}:{int(total_duration % 60):02d}")
+    if transcriptions:
+        total_minutes, total_seconds = divmod(int(transcriptions[-1]['end_time']), 60)
+        footer += f"\nTotal duration: {total_minutes}:{total_seconds:02d}"
     
-    complete_transcript = '\n'.join(transcript_lines)
+    complete_transcript = header + body + footer
     
     # Save to file if path provided
     if output_path:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(complete_transcript)
+        output_path.write_text(complete_transcript, encoding='utf-8')
         
         logger.info(f"Complete transcript saved to: {output_path}")
     
@@ -307,8 +728,14 @@ def create_transcript_metadata(
         Dictionary containing transcription metadata
     """
     total_segments = len(transcriptions)
-    total_duration = transcriptions[-1]['end_time'] if transcriptions else 0.0
-    total_words = sum(len(t['text'].split()) for t in transcriptions)
+    total_duration = 0.0
+    total_words = 0
+    
+    # Single pass; duration is the latest end time, independent of list order
+    for trans in transcriptions:
+        total_words += len(trans['text'].split())
+        if trans['end_time'] > total_duration:
+            total_duration = trans['end_time']
     
     return {
         'source_audio': audio_file,
@@ -27,15 +27,14 @@ Requires boto3:  `pip install boto3`
 from __future__ import annotations
 
 import argparse
+import functools
 import mimetypes
 import os
 import sys
 import uuid
 from pathlib import Path
 
-import boto3
-from botocore.config import Config
-from botocore.exceptions import ClientError
+# boto3/botocore are imported lazily so `--help` and `--dry-run` stay fast
 
 
 DEFAULT_ENDPOINT = "https://minio-api-minio.apps.rosa.rosa-58cx6.acrs.p3.openshiftapps.com"
@@ -43,6 +42,12 @@ DEFAULT_BUCKET = "audio-inbox"
 DEFAULT_ACCESS_KEY = "minioadmin"
 DEFAULT_SECRET_KEY = "minioadmin123"
 
+# Files below this size go up in a single PUT, which returns the ETag directly;
+# larger ones use multipart uploads with parts of MULTIPART_CHUNKSIZE
+MULTIPART_THRESHOLD = 16 * 1024 * 1024
+MULTIPART_CHUNKSIZE = 16 * 1024 * 1024
+MAX_CONCURRENCY = 32
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -106,6 +111,34 @@ def build_object_key(args: argparse.Namespace, file_path: Path) -> str:
     return f"{prefix}/{random_name}" if prefix else random_name
 
 
+@functools.lru_cache(maxsize=None)
+def get_s3(endpoint: str, access_key: str, secret_key: str, verify: bool = True):
+    """Return a shared, connection-pooled S3 client for the given endpoint/credentials.
+
+    Building a boto3 client loads service models from disk, so callers that
+    upload repeatedly (e.g. when importing this module) should reuse it.
+    """
+    import boto3
+    from botocore.config import Config
+
+    session = boto3.session.Session(
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+    )
+
+    return session.client(
+        "s3",
+        endpoint_url=endpoint,
+        config=Config(
+            signature_version="s3v4",
+            max_pool_connections=64,
+            tcp_keepalive=True,
+            retries={"max_attempts": 5, "mode": "standard"},
+        ),
+        verify=verify,
+    )
+
+
 def main() -> int:
     args = parse_args()
 
@@ -126,32 +159,42 @@ def main() -> int:
         print("[dry-run] Skipping upload.")
         return 0
 
-    session = boto3.session.Session(
-        aws_access_key_id=args.access_key,
-        aws_secret_access_key=args.secret_key,
-    )
+    from boto3.s3.transfer import TransferConfig
+    from botocore.exceptions import ClientError
 
-    client = session.client(
-        "s3",
-        endpoint_url=args.endpoint,
-        config=Config(signature_version="s3v4"),
-        verify=not args.no_verify,
-    )
+    client = get_s3(args.endpoint, args.access_key, args.secret_key, verify=not args.no_verify)
+
+    size = args.file.stat().st_size
 
     try:
-        client.upload_file(
-            Filename=str(args.file),
-            Bucket=args.bucket,
-            Key=object_key,
-            ExtraArgs={"ContentType": content_type},
-        )
-        head = client.head_object(Bucket=args.bucket, Key=object_key)
+        if size < MULTIPART_THRESHOLD:
+            with args.file.open("rb") as body:
+                response = client.put_object(
+                    Bucket=args.bucket,
+                    Key=object_key,
+                    Body=body,
+                    ContentType=content_type,
+                )
+            etag = response.get("ETag", "?")
+        else:
+            client.upload_file(
+                Filename=str(args.file),
+                Bucket=args.bucket,
+                Key=object_key,
+                ExtraArgs={"ContentType": content_type},
+                Config=TransferConfig(
+                    multipart_threshold=MULTIPART_THRESHOLD,
+                    multipart_chunksize=MULTIPART_CHUNKSIZE,
+                    max_concurrency=MAX_CONCURRENCY,
+                    use_threads=True,
+                ),
+            )
+            # Skip a HEAD round trip just to report the multipart ETag
+            etag = "(multipart upload, not fetched)"
     except ClientError as exc:
         print(f"[error] Upload failed: {exc}", file=sys.stderr)
         return 1
 
-    etag = head.get("ETag", "?")
-    size = head.get("ContentLength", "?")
     print("Upload complete:")
     print(f"  ETag  : {etag}")
     print(f"  Size  : {size} bytes")